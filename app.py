@@ -10,7 +10,16 @@ Run with:  streamlit run app.py
 import streamlit as st
 import os
 import json
-from groq import Groq
+import re
+import hashlib
+import logging
+import asyncio
+import copy
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 # Import everything from our game engine
 from simulator import (
@@ -25,18 +34,381 @@ from simulator import (
     generate_performance_feedback,
     COMM_STYLE_EFFECTS,
     RECOMMENDATION_EFFECTS,
+    RISK_STOCK_RANGES,
+    INTENT_DESCRIPTIONS,
     fmt_pct,
     clamp,
 )
 
 
+# Under `streamlit run` this file is __main__, whose logger has no handler, so
+# INFO records (token usage, grades) would be silently dropped. Give the app
+# its own logger with a handler. The script reruns on every click, so it is
+# only set up the first time.
+logger = logging.getLogger("wealth_simulator")
+if not logger.handlers:
+    _log_handler = logging.StreamHandler()
+    _log_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    logger.addHandler(_log_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False  # don't print twice if the root logger is configured too
+
+
+# ─────────────────────────────────────────────
+# DISPLAY CONSTANTS
+# ─────────────────────────────────────────────
+# Static lookups live here (built once) instead of being rebuilt on every rerun.
+
+# Emoji shown next to each market regime
+REGIME_ICONS = {
+    "Bull Market":     "🟢",
+    "Bear Market":     "🔴",
+    "Market Crisis":   "🚨",
+    "Recovery":        "🔵",
+    "Sideways / Flat": "🟡",
+    "Rate Shock":      "🟠",
+}
+
+
+# One labelled progress bar, styled like st.progress (default theme colours)
+PROGRESS_BAR_HTML = (
+    '<div style="margin-bottom:0.75rem">'
+    '<div style="font-size:0.875rem;margin-bottom:0.25rem">{label}</div>'
+    '<div style="background:rgba(151,166,195,0.25);border-radius:0.25rem;height:0.5rem">'
+    '<div style="width:{value}%;background:#ff4b4b;border-radius:0.25rem;height:0.5rem"></div>'
+    '</div></div>'
+)
+
+
+# ─────────────────────────────────────────────
+# PRE-FORMATTED PAGE TEXT (cached)
+# ─────────────────────────────────────────────
+# Within one turn the market numbers and feelings don't change, yet every
+# click (toggling Quick Turn, opening a dropdown...) reruns the whole script
+# and rebuilds the same labels. These helpers format them once per set of
+# inputs; later reruns get the finished strings back from the cache.
+# lru_cache, not st.cache_data: these are microseconds of formatting, and
+# st.cache_data's hashing and unpickling would cost far more than it saves.
+
+@lru_cache(maxsize=64)
+def _fmt_market_card(regime, description, stock_r, bond_r, cash_r, port_ret):
+    """Ready-to-display strings for the market summary."""
+    icon = REGIME_ICONS.get(regime, "⚪")
+    return {
+        "learning_heading": f"### {icon} Market This Period: {regime}",
+        "sim_heading":      f"### {icon} {regime}",
+        "description":      description,
+        "stocks":           fmt_pct(stock_r),
+        "bonds":            fmt_pct(bond_r),
+        "cash":             fmt_pct(cash_r),
+        "portfolio":        fmt_pct(port_ret),
+    }
+
+
+@lru_cache(maxsize=64)
+def _fmt_emotion_progress(trust, anxiety, satisfaction):
+    """
+    The three feelings as progress bars, in learning-mode and simulation-mode wording.
+    All three bars are ONE block of HTML, so the page gets one element instead of three widgets.
+    """
+    labels = {
+        "learning": (
+            f"Trust: {trust}/100 — {'High ✅' if trust > 60 else 'Low ⚠️'}",
+            f"Anxiety: {anxiety}/100 — {'High ⚠️' if anxiety > 60 else 'Normal ✅'}",
+            f"Satisfaction: {satisfaction}/100",
+        ),
+        "simulation": (
+            f"Trust: {trust}/100",
+            f"Anxiety: {anxiety}/100",
+            f"Satisfaction: {satisfaction}/100",
+        ),
+    }
+    values = (trust, anxiety, satisfaction)
+    return {
+        mode: "".join(PROGRESS_BAR_HTML.format(label=label, value=value) for label, value in zip(texts, values))
+        for mode, texts in labels.items()
+    }
+
+
+# Feedback-panel columns: (label, key in the changes dict, +1 if going up is good)
+EMOTION_COLUMNS = (
+    ("Trust", "trust", 1), ("Anxiety", "anxiety", -1),
+    ("Satisfaction", "satisfaction", 1), ("Engagement", "engagement", 1),
+)
+EMOTION_LABELS = tuple(label for label, _, _ in EMOTION_COLUMNS)
+CHANGE_COLORS  = {True: "green", False: "red"}  # keyed on "did it move the good way?"
+CHANGE_ARROWS  = {True: "▲", False: "▼"}        # keyed on "did it go up?"
+GRADE_COLUMNS  = (
+    ("Empathy", "empathy"), ("Clarity", "clarity"),
+    ("Goal Alignment", "alignment"), ("Professionalism", "professionalism"),
+)
+GRADE_LABELS   = tuple(label for label, _ in GRADE_COLUMNS)
+
+# Sentences for the "what happened" list, keyed by the kind of each breakdown entry
+BREAKDOWN_TEMPLATES = {
+    "market":  "📈 Market conditions {} anxiety by {} pts",
+    "comm":    "💬 Communication: {}",
+    "rec":     "📋 Recommendation: {}",
+    "fit":     "⚖️ Allocation fit: {}",
+    "written": "✍️ Written response: {}",
+}
+
+
+def _md_table(headers, cells):
+    """A one-row markdown table (one element on the page instead of a column per value)."""
+    return (
+        "| " + " | ".join(headers) + " |\n"
+        + "|" + ":-:|" * len(headers) + "\n"
+        + "| " + " | ".join(cells) + " |"
+    )
+
+
+def _format_breakdown(entries):
+    """Turns calculate_full_turn_deltas' (kind, details...) entries into display sentences."""
+    return [BREAKDOWN_TEMPLATES[kind].format(*details) for kind, *details in entries]
+
+
+def _changes_table(changes):
+    """Emotional changes as a table, coloured green when the move is good for the relationship."""
+    return _md_table(EMOTION_LABELS, [
+        "±0" if val == 0 else f":{CHANGE_COLORS[val * good > 0]}[{CHANGE_ARROWS[val > 0]} {val:+d}]"
+        for val, good in ((changes[key], good) for _, key, good in EMOTION_COLUMNS)
+    ])
+
+
+def _grades_table(grades):
+    """The four written-response scores as a table."""
+    return _md_table(
+        GRADE_LABELS,
+        [f"{grades[key]:+d}" for _, key in GRADE_COLUMNS],
+    )
+
+
+def _format_log_line(entry):
+    """One line of the turn history, e.g. '**Turn 3** | Bear Market | Return: -4.2% | ...'."""
+    chg = entry["emotional_changes"]
+    return " | ".join([
+        f"**Turn {entry['turn']}**",
+        entry["regime"],
+        f"Return: {fmt_pct(entry['portfolio_return'])}",
+        f"Value: \\${entry['portfolio_value']:,.0f}",  # escaped: the lines share one markdown block
+        f"Trust {chg['trust']:+d}",
+        f"Anxiety {chg['anxiety']:+d}",
+    ])
+
+
+def _log_markdown(entries):
+    """All the history lines as ONE markdown block (one page element instead of one per turn)."""
+    return "\n\n".join(entry["display_line"] for entry in entries)
+
+
+# ─────────────────────────────────────────────
+# LLM CALLS (cached)
+# ─────────────────────────────────────────────
+# Every AI feature below boils down to "send this prompt, get text back".
+# These two helpers are the only places that actually talk to Groq.
+#
+# CACHING LESSON:
+# Streamlit reruns the whole script on every click, so it's easy to ask the
+# AI the exact same question twice. @st.cache_data remembers the answer for
+# each unique prompt, so a repeat costs nothing. Errors are raised (not
+# returned) so a failed call is never cached.
+
+# Big model for the creative writing, small fast model for the rubric grading
+CREATIVE_MODEL = "llama-3.3-70b-versatile"
+GRADER_MODEL   = "llama-3.1-8b-instant"
+
+# Output budgets. Generation time grows with every token written, so each text
+# gets only what it needs, and both stop at the first blank line (they're
+# meant to be a single paragraph).
+CLIENT_MESSAGE_MAX_TOKENS = 120  # 2-4 sentences
+COMMENTARY_MAX_TOKENS     = 90   # exactly 2 sentences
+PARAGRAPH_STOP            = "\n\n"
+
+
+# TIMEOUT LESSON:
+# By default the SDK waits up to a minute for a reply and quietly retries
+# twice, so one stuck request could freeze a turn for minutes. We give each
+# request 8 seconds, retry ONCE with a shorter 4 second limit if the connection
+# failed or timed out or Groq had a server error (5xx), and otherwise let the
+# caller use its fallback. A rate limit (429) is NOT retried: Groq tells us how
+# long to wait (retry-after), usually longer than a turn can afford, and an
+# immediate retry would just be rejected again.
+REQUEST_TIMEOUT = 8.0
+RETRY_TIMEOUT   = 4.0
+
+
+def _is_retryable(err):
+    """
+    Connection problems (including timeouts and a reused keep-alive connection
+    the server already closed) and Groq-side (5xx) errors are worth one more
+    try; bad requests and rate limits are not.
+    """
+    from groq import APIConnectionError, APIStatusError
+    if isinstance(err, APIConnectionError):  # APITimeoutError is a kind of APIConnectionError
+        return True
+    return isinstance(err, APIStatusError) and err.status_code >= 500
+
+
+def _chat_messages(system, user):
+    """Builds the messages list. `system` is optional."""
+    messages = [{"role": "system", "content": system}] if system else []
+    messages.append({"role": "user", "content": user})
+    return messages
+
+
+def _log_usage(response):
+    """Logs how many prompt tokens Groq served from its automatic prompt cache."""
+    usage   = response.usage
+    details = getattr(usage, "prompt_tokens_details", None) if usage else None
+    if details is not None:
+        logger.info("Groq prompt tokens: %d (cached: %d)", usage.prompt_tokens, details.cached_tokens or 0)
+
+
+@st.cache_resource
+def _groq():
+    """
+    One shared Groq client for the whole app.
+    Building a client sets up a new HTTP connection pool and TLS context; reusing
+    one keeps connections alive between calls. @st.cache_resource is Streamlit's
+    tool for exactly this kind of shared object (DB connections, API clients, models).
+
+    LESSON: The groq SDK (with httpx and pydantic behind it) is imported here,
+    not at the top of the file. The intro screen never calls the AI, so the
+    first page load doesn't pay for importing it.
+    """
+    from groq import Groq
+    return Groq(max_retries=0)  # retries are handled by _create (see TIMEOUT LESSON)
+
+
+@st.cache_resource
+def _agroq():
+    """One shared AsyncGroq client, so its connection pool is reused across reruns."""
+    from groq import AsyncGroq
+    return AsyncGroq(max_retries=0)
+
+
+def _create(**request):
+    """chat.completions.create with our timeout and single retry."""
+    try:
+        return _groq().chat.completions.create(timeout=REQUEST_TIMEOUT, **request)
+    except Exception as err:
+        if not _is_retryable(err):
+            raise
+        return _groq().chat.completions.create(timeout=RETRY_TIMEOUT, **request)
+
+
+async def _acreate(**request):
+    """Async version of _create."""
+    try:
+        return await _agroq().chat.completions.create(timeout=REQUEST_TIMEOUT, **request)
+    except Exception as err:
+        if not _is_retryable(err):
+            raise
+        return await _agroq().chat.completions.create(timeout=RETRY_TIMEOUT, **request)
+
+
+@st.cache_data(ttl=3600, max_entries=512, show_spinner=False)
+def _llm_call(system, user, temperature, max_tokens, json_mode=False, model=CREATIVE_MODEL):
+    """
+    One Groq chat completion, cached by prompt. Returns the reply text.
+    json_mode=True makes Groq guarantee the reply is a valid JSON object.
+    """
+    extra = {"response_format": {"type": "json_object"}} if json_mode else {}
+    response = _create(
+        model=model,
+        max_tokens=max_tokens,
+        temperature=temperature,
+        messages=_chat_messages(system, user),
+        **extra,
+    )
+    _log_usage(response)
+    return response.choices[0].message.content.strip()
+
+
+@st.cache_data(ttl=3600, max_entries=512, show_spinner=False)
+async def _allm_call(system, user, temperature, max_tokens, model=CREATIVE_MODEL, stop=None):
+    """
+    Async version of _llm_call (same cache rules), plus `stop`, which ends the
+    reply early when that text is generated. An empty reply raises instead,
+    so it isn't cached and the caller falls back to its canned text.
+    """
+    extra = {"stop": stop} if stop else {}
+    response = await _acreate(
+        model=model,
+        max_tokens=max_tokens,
+        temperature=temperature,
+        messages=_chat_messages(system, user),
+        **extra,
+    )
+    _log_usage(response)
+    text = (response.choices[0].message.content or "").strip()
+    if not text:
+        raise ValueError("empty completion")
+    return text
+
+
 # ─────────────────────────────────────────────
 # AI CLIENT MESSAGE GENERATOR
 # ─────────────────────────────────────────────
 
-def generate_client_message_ai(context):
+# PROMPT CACHING LESSON:
+# Groq automatically caches the start (prefix) of prompts it has seen before,
+# which makes repeat prompts cheaper and faster. That only works if the prompt
+# STARTS with text that never changes — so all the static instructions live in
+# these constants, and the per-turn details go at the very end.
+
+CLIENT_MESSAGE_SYSTEM_PROMPT = """You are a client of a financial advisor — a real person with money invested with them.
+How you write:
+- You speak casually, like a real person texting or emailing
+- You NEVER sound like a financial textbook
+- You vary your sentence structure and word choice every single time
+- You sometimes ramble, ask multiple questions, or express contradictory feelings — like real people do
+
+Rules for every message:
+- 2-4 sentences MAX
+- No greetings like "Hi" or "Dear"
+- No financial jargon unless you're sarcastically repeating something your advisor said
+- Reference your specific goal naturally
+- Show your actual emotion — don't be polite if you're scared
+- NEVER start with "I wanted to" or "I'm reaching out" — those are corporate phrases
+- Make it sound completely different from a generic financial message
+- Write ONLY the message. Nothing else."""
+
+# How the client describes themselves, by anxiety / trust level (see _bucket)
+ANXIETY_DESC = {
+    "high": "very anxious and emotional",
+    "med":  "moderately concerned",
+    "low":  "calm and rational",
+}
+TRUST_DESC = {
+    "high": "high — you generally believe in them",
+    "med":  "moderate — you want reassurance",
+    "low":  "low — you are skeptical of their advice",
+}
+
+
+def _bucket(x, high, med):
+    """'high' if x > high, 'med' if x > med, otherwise 'low'."""
+    return "high" if x > high else "med" if x > med else "low"
+
+
+@lru_cache(maxsize=256)
+def _persona_block(name, anxiety_bucket, trust_bucket):
+    """
+    The "Who you are" part of the client prompt. Only 3 x 3 mood combinations
+    per client, so each finished block is built once and reused.
     """
-    Uses Groq (Llama 3) to generate a realistic, personalized client message.
+    return f"""Who you are:
+- Your name is {name}
+- You are {ANXIETY_DESC[anxiety_bucket]} about money
+- Your trust in your advisor is {TRUST_DESC[trust_bucket]}"""
+
+
+def _client_message_prompts(context):
+    """
+    Builds the (system, user) prompt pair for the client message.
+    Shared by the async (prefetch) and the streamed generator so both send the exact same prompt.
 
     PROMPT ENGINEERING LESSON:
     The quality of AI output is almost entirely determined by prompt quality.
@@ -47,22 +419,12 @@ def generate_client_message_ai(context):
     - Add a "temperature hint" by telling it to be unpredictable
     - Use a system message (role: system) to set behavior separately from the request
     """
-    try:
-        groq_client = Groq()
-
-        # SYSTEM MESSAGE — sets the AI's overall behavior and personality
-        # This is separate from the actual request (user message below)
-        system_msg = f"""You are {context['client_name']}, a real person with money invested with a financial advisor.
-You have a specific personality:
-- You are {'very anxious and emotional' if context['anxiety'] > 70 else 'moderately concerned' if context['anxiety'] > 45 else 'calm and rational'} about money
-- Your trust in your advisor is {'high — you generally believe in them' if context['trust'] > 65 else 'moderate — you want reassurance' if context['trust'] > 40 else 'low — you are skeptical of their advice'}
-- You speak casually, like a real person texting or emailing
-- You NEVER sound like a financial textbook
-- You vary your sentence structure and word choice every single time
-- You sometimes ramble, ask multiple questions, or express contradictory feelings — like real people do"""
+    persona = _persona_block(
+        context['client_name'], _bucket(context['anxiety'], 70, 45), _bucket(context['trust'], 65, 40)
+    )
 
-        # USER MESSAGE — the specific situation this turn
-        user_msg = f"""Write your message to your financial advisor RIGHT NOW.
+    # USER MESSAGE — the specific situation this turn, plus who you are right now
+    user_msg = f"""Write your message to your financial advisor RIGHT NOW.
 
 The situation:
 - It's check-in #{context['turn_number']} of your relationship
@@ -73,30 +435,9 @@ The situation:
 - Your anxiety right now: {context['anxiety']}/100
 - Your current mood: {context['intent_description']}
 
-Rules:
-- 2-4 sentences MAX
-- No greetings like "Hi" or "Dear"
-- No financial jargon unless you're sarcastically repeating something your advisor said
-- Reference your specific goal ({context['client_goal']}) naturally
-- Show your actual emotion — don't be polite if you're scared
-- NEVER start with "I wanted to" or "I'm reaching out" — those are corporate phrases
-- Make it sound completely different from a generic financial message
+{persona}"""
 
-Write ONLY the message. Nothing else."""
-
-        response = groq_client.chat.completions.create(
-            model="llama-3.3-70b-versatile",
-            max_tokens=200,
-            temperature=0.9,  # higher = more creative/varied (0=robotic, 1=creative)
-            messages=[
-                {"role": "system", "content": system_msg},
-                {"role": "user",   "content": user_msg}
-            ]
-        )
-        return response.choices[0].message.content.strip()
-
-    except Exception as e:
-        return _fallback_client_message(context)
+    return CLIENT_MESSAGE_SYSTEM_PROMPT, user_msg
 
 
 def _fallback_client_message(context):
@@ -120,14 +461,43 @@ def _fallback_client_message(context):
     return messages.get(intent, f"{name}: How are we looking this period?")
 
 
+# Kept deliberately terse — every word here is paid for on every graded turn.
+# One short example line pins down the "S:" format; JSON mode is only the
+# fallback (GRADER_JSON_PROMPT), where Groq enforces the shape itself.
+GRADER_SYSTEM_PROMPT = """Grade a financial advisor's reply to a client. Score -2..+2: empathy (acknowledges feelings), clarity (explains what's happening), alignment (addresses the client's goal), professionalism (tone). Reply in exactly two lines:
+S: <the four scores in that order, space-separated, e.g. +1 0 -1 +2>
+C: <one sentence of specific coaching>"""
+
+# Backup format, used only if the reply above doesn't parse
+GRADER_JSON_PROMPT = """Grade a financial advisor's reply to a client. Score -2..+2 per key: empathy (acknowledges feelings), clarity (explains what's happening), alignment (addresses the client's goal), professionalism (tone). Add "feedback": one sentence of specific coaching. Reply in JSON."""
+
+# Matches the two-line "S: ... / C: ..." grade (the comment stops at the end of its line)
+GRADE_LINE_PATTERN = re.compile(
+    r"S:\s*([+-]?\d)\s+([+-]?\d)\s+([+-]?\d)\s+([+-]?\d)\s*[\r\n]+C:[ \t]*([^\r\n]*)"
+)
+
+
+# Returned without calling the AI when the response is too short to judge
+SHORT_RESPONSE_GRADE = {
+    "empathy": 0, "clarity": 0, "alignment": 0, "professionalism": 0,
+    "feedback": "Too short to grade — a few full sentences give the client something to hold on to.",
+    "d_trust": 0, "d_anxiety": 0, "d_satisfaction": 0,
+}
+
+
 def grade_free_text_ai(user_text, context, intent):
     """
     Uses Groq to grade the advisor's free text response.
 
     PROMPT ENGINEERING LESSON:
-    We ask the AI to return structured JSON instead of a paragraph.
+    We ask the AI for a fixed, structured format instead of a paragraph.
     This is called structured output — we tell the AI exactly what format
     we want so we can parse and use it reliably in our code.
+    The format is as short as possible ("S: +1 0 -1 +2" plus one coaching line),
+    because the AI writes word by word: JSON key names like "professionalism"
+    would cost more time than the four numbers themselves. If the short reply
+    ever fails to parse, we ask again in Groq's JSON mode, which GUARANTEES
+    the reply parses.
 
     FINANCE LESSON:
     The four dimensions we grade (empathy, clarity, alignment, professionalism)
@@ -138,94 +508,392 @@ def grade_free_text_ai(user_text, context, intent):
     if not user_text or len(user_text.strip()) < 10:
         return None  # don't grade if they barely wrote anything
 
+    text = " ".join(user_text.split())  # normalize whitespace
+    if len(text.split()) < 5:
+        return dict(SHORT_RESPONSE_GRADE)  # "ok thanks......" isn't worth an AI call
+
+    # The same text in the same situation gets the same grade, so resubmits are free.
+    # "Same situation" = every detail the grader's prompt shows. The cache is shared
+    # by all sessions, so anything left out could leak one client's name or numbers
+    # into another client's feedback.
+    text_key = hashlib.blake2b(text.lower().encode("utf-8"), digest_size=16).hexdigest()
     try:
-        import json
-        groq_client = Groq()
+        return _grade_cached(
+            text_key, intent, context["client_name"], context["client_goal"], context["regime"],
+            context["portfolio_value_direction"], context["portfolio_return_pct"], context["anxiety"],
+            text,
+        )
+    except Exception:
+        return None
 
-        prompt = f"""You are evaluating a financial advisor's written response to a client.
 
-CLIENT SITUATION:
-- Client name: {context['client_name']}
-- Client goal: {context['client_goal']}
-- Market this period: {context['regime']} — portfolio {context['portfolio_value_direction']} {context['portfolio_return_pct']}
-- Client emotional state: {context['intent_description']}
-- Client anxiety: {context['anxiety']}/100
+@st.cache_data(ttl=3600, max_entries=512, show_spinner=False)
+def _grade_cached(text_key, intent, name, goal, regime, direction, return_pct, anxiety, _text):
+    """
+    Does the actual grading call. Cached on the text hash plus everything else
+    the prompt contains — _text itself is passed through but not hashed again.
+    """
+    prompt = f"""Client: {name}, saving for {goal}
+Market: {regime}, portfolio {direction} {return_pct}
+Mood: {INTENT_DESCRIPTIONS[intent]}, anxiety {anxiety}/100
+Advisor: "{_text}"
+"""
 
-ADVISOR'S RESPONSE:
-"{user_text}"
+    raw   = _llm_call(GRADER_SYSTEM_PROMPT, prompt, temperature=0.2, max_tokens=60, model=GRADER_MODEL)
+    match = GRADE_LINE_PATTERN.match(raw)
+    if match:
+        grades = dict(zip(["empathy", "clarity", "alignment", "professionalism"], match.groups()[:4]))
+        grades["feedback"] = match.group(5).strip()
+    else:
+        # JSON mode: Groq constrains the output to valid JSON, so there are
+        # no markdown fences to strip and no prose around the object.
+        raw = _llm_call(
+            GRADER_JSON_PROMPT, prompt, temperature=0.2, max_tokens=100,
+            json_mode=True, model=GRADER_MODEL,
+        )
+        grades = json.loads(raw)
 
-Grade this response on four dimensions, each scored -2 to +2:
-- empathy: Did they acknowledge the client's feelings? (-2=dismissive, 0=neutral, +2=excellent)
-- clarity: Did they explain what's happening clearly? (-2=confusing, 0=neutral, +2=very clear)
-- alignment: Did they reference the client's specific goal ({context['client_goal']})? (-2=ignored goal, 0=neutral, +2=directly addressed)
-- professionalism: Was the tone appropriate? (-2=unprofessional, 0=neutral, +2=very professional)
+    # A grade without coaching text is a failed grade (the caller shows none)
+    if not isinstance(grades.get("feedback"), str) or not grades["feedback"].strip():
+        raise ValueError("grade has no feedback")
+    for k in ["empathy", "clarity", "alignment", "professionalism"]:
+        grades[k] = clamp(int(grades[k]), -2, 2)
 
-Also write one sentence of specific coaching feedback.
+    # Logged so grade distributions can be compared across grader models
+    logger.info(
+        "Grade (%s): empathy=%d clarity=%d alignment=%d professionalism=%d",
+        GRADER_MODEL, grades["empathy"], grades["clarity"], grades["alignment"], grades["professionalism"],
+    )
 
-Respond ONLY with valid JSON in exactly this format, nothing else:
-{{"empathy": 0, "clarity": 0, "alignment": 0, "professionalism": 0, "feedback": "your feedback here"}}"""
+    total = grades["empathy"] + grades["clarity"] + grades["alignment"] + grades["professionalism"]
+    grades["d_trust"]        = clamp(int(total * 0.8), -6, 6)
+    grades["d_anxiety"]      = clamp(int(-total * 0.6), -5, 5)
+    grades["d_satisfaction"] = clamp(int(total * 0.5), -4, 4)
 
-        response = groq_client.chat.completions.create(
-            model="llama-3.3-70b-versatile",
-            max_tokens=150,
-            temperature=0.2,
-            messages=[{"role": "user", "content": prompt}]
-        )
+    return grades
 
-        raw = response.choices[0].message.content.strip()
 
-        # Strip markdown code blocks if model wraps in them
-        if raw.startswith("```"):
-            raw = raw.split("```")[1]
-            if raw.startswith("json"):
-                raw = raw[4:]
+def _market_commentary_prompt(market, portfolio_return):
+    """
+    Builds the market commentary prompt: a brief educational note each turn that
+    teaches the user what's happening in the market and why (shared by the async
+    and streamed generator).
+    The return is rounded to the nearest whole percent — the commentary doesn't
+    need more precision, and it makes repeat prompts (cache hits) far more likely.
+    """
+    portfolio_return = round(portfolio_return, 2)
+    return f"""You are a sharp, conversational finance professor explaining a market event to a smart student who is new to investing.
 
-        grades = json.loads(raw)
+Write exactly 2 sentences:
+1. A real-world explanation of WHY this market condition happens — reference something concrete like interest rates, corporate earnings, inflation, investor sentiment, or a historical parallel
+2. One specific thing a skilled wealth manager does differently than an average one in this environment
 
-        for k in ["empathy", "clarity", "alignment", "professionalism"]:
-            grades[k] = clamp(int(grades[k]), -2, 2)
+Tone: Smart but plain English. No bullet points. No fluff. Make it genuinely interesting and educational — something the student would actually remember.
+Write ONLY the 2 sentences. Nothing else.
 
-        total = grades["empathy"] + grades["clarity"] + grades["alignment"] + grades["professionalism"]
-        grades["d_trust"]        = clamp(int(total * 0.8), -6, 6)
-        grades["d_anxiety"]      = clamp(int(-total * 0.6), -5, 5)
-        grades["d_satisfaction"] = clamp(int(total * 0.5), -4, 4)
+What just happened: {market['regime']} — {market['description']}
+Portfolio result: {fmt_pct(portfolio_return)} this period"""
 
-        return grades
 
-    except Exception:
-        return None
+def _fallback_market_commentary(portfolio_return):
+    """Plain one-line commentary if the AI is unavailable."""
+    return f"Market conditions resulted in a {fmt_pct(portfolio_return)} portfolio return this period."
+
+
+# Finished commentaries kept by _commentary_memo (oldest dropped first)
+COMMENTARY_MEMO_SIZE = 256
+
+
+@st.cache_resource
+def _commentary_memo():
+    """
+    Every finished market commentary, keyed by prompt and shared by all sessions.
+
+    The commentary depends only on the regime, its description and the return
+    rounded to a whole percent (the client's name isn't used), and the prompt
+    holds exactly those — so the prompt is the key. With six regimes and a few
+    dozen likely returns, most turns after the first few sessions are repeats.
+    The async generator (background prefetch) and the streamed one share this
+    memo, so a commentary written by one is reused by the other.
+    """
+    return {}
+
 
+def _remember_commentary(prompt, text):
+    """Stores a finished (non-fallback) commentary in the memo."""
+    memo = _commentary_memo()
+    if len(memo) >= COMMENTARY_MEMO_SIZE:
+        memo.pop(next(iter(memo)), None)
+    memo[prompt] = text
+    return text
 
-def generate_market_commentary_ai(market, portfolio_return, client_name):
+
+# ─────────────────────────────────────────────
+# CONCURRENT AI CALLS
+# ─────────────────────────────────────────────
+# The client message and the market commentary don't depend on each other,
+# so there's no reason to wait for one before asking for the other.
+# Firing both at once means a new turn takes as long as the SLOWER call,
+# not the two calls added together.
+
+@st.cache_resource
+def _event_loop():
     """
-    Uses Groq to generate a brief educational market commentary each turn.
-    Teaches the user what's happening in the market and why.
+    A single long-lived asyncio loop running on a background thread.
+
+    WHY NOT asyncio.run() EVERY TURN?
+    The AsyncGroq connection pool belongs to the loop that opened it.
+    asyncio.run() closes its loop when it returns, which would leave the cached
+    client holding dead connections on the next turn.
     """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+
+def _run_async(coro):
+    """Runs a coroutine on the shared loop and blocks until it finishes."""
+    return asyncio.run_coroutine_threadsafe(coro, _event_loop()).result()
+
+
+async def _agenerate_client_message(context):
+    """Generates the client message with Groq (Llama 3), or the fallback text if that fails."""
     try:
-        groq_client = Groq()
+        system_msg, user_msg = _client_message_prompts(context)
+        return await _allm_call(
+            system_msg, user_msg, temperature=0.9,
+            max_tokens=CLIENT_MESSAGE_MAX_TOKENS, stop=PARAGRAPH_STOP,
+        )
 
-        prompt = f"""You are a sharp, conversational finance professor explaining a market event to a smart student who is new to investing.
+    except Exception:
+        return _fallback_client_message(context)
 
-What just happened: {market['regime']} — {market['description']}
-Portfolio result: {fmt_pct(portfolio_return)} this period
 
-Write exactly 2 sentences:
-1. A real-world explanation of WHY this market condition happens — reference something concrete like interest rates, corporate earnings, inflation, investor sentiment, or a historical parallel
-2. One specific thing a skilled wealth manager does differently than an average one in this environment
+async def _agenerate_market_commentary(market, portfolio_return, client_name):
+    """Generates the market commentary with Groq, or the fallback text if that fails."""
+    try:
+        prompt = _market_commentary_prompt(market, portfolio_return)
+        if prompt in _commentary_memo():
+            return _commentary_memo()[prompt]
+        text = await _allm_call(
+            None, prompt, temperature=0.8, max_tokens=COMMENTARY_MAX_TOKENS, stop=PARAGRAPH_STOP,
+        )
+        return _remember_commentary(prompt, text)
+
+    except Exception:
+        return _fallback_market_commentary(portfolio_return)
 
-Tone: Smart but plain English. No bullet points. No fluff. Make it genuinely interesting and educational — something the student would actually remember.
-Write ONLY the 2 sentences. Nothing else."""
 
-        response = groq_client.chat.completions.create(
-            model="llama-3.3-70b-versatile",
-            max_tokens=150,
-            temperature=0.8,
-            messages=[{"role": "user", "content": prompt}]
+def generate_turn_text_ai(context, market, portfolio_return, client_name):
+    """
+    Generates the client message AND the market commentary for a turn, concurrently.
+    Returns (client_message, market_commentary).
+    """
+    async def _both():
+        return await asyncio.gather(
+            _agenerate_client_message(context),
+            _agenerate_market_commentary(market, portfolio_return, client_name),
         )
-        return response.choices[0].message.content.strip()
+    return tuple(_run_async(_both()))
+
 
+# ─────────────────────────────────────────────
+# STREAMING AI TEXT
+# ─────────────────────────────────────────────
+# Instead of waiting for the whole reply, we show the words as they arrive.
+# The request runs on the shared event loop and drops each chunk of text into
+# a queue; the page reads from that queue while it draws. Because the request
+# starts before the page reads from it, two streams started back-to-back still
+# run at the same time — the second one just fills its queue while the first
+# is being shown.
+
+_STREAM_END     = object()
+AI_PENDING_TEXT = "_✍️ writing…_"
+
+
+async def _apump_stream(chunks, system, user, temperature, max_tokens, fallback, on_done=None):
+    """
+    Streams one completion into the `chunks` queue, ending with _STREAM_END.
+    If the reply arrives in full, on_done(text) is called with it (fallbacks aren't passed on).
+    An empty reply (e.g. the stop sequence came first) is shown as the fallback
+    and never passed to on_done, so it can't end up in a shared memo.
+    """
+    pieces = []
+    try:
+        stream = await _acreate(
+            model=CREATIVE_MODEL,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            messages=_chat_messages(system, user),
+            stop=PARAGRAPH_STOP,
+            stream=True,
+        )
+        async for chunk in stream:
+            piece = chunk.choices[0].delta.content if chunk.choices else None
+            if piece:
+                chunks.put(piece)
+                pieces.append(piece)
+        text = "".join(pieces).strip()
+        if not text:
+            chunks.put(fallback)
+        elif on_done:
+            on_done(text)
     except Exception:
-        return f"Market conditions resulted in a {fmt_pct(portfolio_return)} portfolio return this period."
+        if not pieces:
+            chunks.put(fallback)
+    finally:
+        chunks.put(_STREAM_END)
+
+
+class _TextStream:
+    """
+    The chunks of one streamed reply. Iterating it again first replays what
+    already arrived, then carries on — so a rerun that interrupts the page
+    mid-draw can pick the same reply back up instead of asking for a new one.
+    """
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._seen   = []
+
+    def __iter__(self):
+        yield from list(self._seen)
+        while (piece := self._chunks.get()) is not _STREAM_END:
+            self._seen.append(piece)
+            yield piece
+        self._chunks.put(_STREAM_END)  # later readers stop right after the replay
+
+
+def _stream_llm(system, user, temperature, max_tokens, fallback, on_done=None):
+    """Starts a streaming request right away and returns a _TextStream of its chunks."""
+    chunks = queue.Queue()
+    asyncio.run_coroutine_threadsafe(
+        _apump_stream(chunks, system, user, temperature, max_tokens, fallback, on_done), _event_loop()
+    )
+    return _TextStream(chunks)
+
+
+def stream_client_message_ai(context):
+    """Streaming version of _agenerate_client_message."""
+    system_msg, user_msg = _client_message_prompts(context)
+    return _stream_llm(system_msg, user_msg, 0.9, CLIENT_MESSAGE_MAX_TOKENS, _fallback_client_message(context))
+
+
+def stream_market_commentary_ai(market, portfolio_return, client_name):
+    """Streaming version of _agenerate_market_commentary. Repeats come straight from the memo."""
+    prompt = _market_commentary_prompt(market, portfolio_return)
+    memo   = _commentary_memo()
+    if prompt in memo:
+        return [memo[prompt]]
+    return _stream_llm(
+        None, prompt, 0.8, COMMENTARY_MAX_TOKENS, _fallback_market_commentary(portfolio_return),
+        on_done=lambda text: _remember_commentary(prompt, text),
+    )
+
+
+def show_ai_text(key, streams, alert, prefix=""):
+    """
+    Shows st.session_state[key] in an alert box (st.info / st.warning).
+    If that text is still being generated, fills the box in as the words arrive
+    and saves the finished text, so later reruns just show it. The stream is only
+    dropped from `streams` once it is finished.
+    """
+    box = getattr(st.empty(), alert)
+    if key not in streams:
+        box(prefix + st.session_state[key])
+        return
+
+    box(prefix + AI_PENDING_TEXT)  # shown until the first words arrive
+    text = ""
+    for piece in streams[key]:
+        text += piece
+        box(prefix + text)
+    st.session_state[key] = text.strip()
+    del streams[key]
+
+
+# ─────────────────────────────────────────────
+# NEXT-TURN PREFETCH
+# ─────────────────────────────────────────────
+# The user spends many seconds reading the client message and deciding what
+# to do. We use that idle time to SPECULATIVELY generate the next turn in the
+# background, assuming the most common path: the default communication style
+# and "stay the course". On Submit, anything the guess got right is reused
+# instantly; anything it got wrong is generated the normal way.
+
+SPECULATIVE_COMM_STYLE     = next(iter(COMM_STYLE_EFFECTS))
+SPECULATIVE_RECOMMENDATION = "Stay the course (no change)"
+
+
+@st.cache_resource
+def _worker_pool():
+    """
+    Shared worker threads for the next-turn prefetch (avoids creating a thread on every rerun).
+    Shared by EVERY session. Only speculative work runs here: a prefetch that is
+    already running can't be cancelled and keeps its worker until it finishes,
+    so nothing the user is waiting on (like the grade) is ever queued behind it.
+    """
+    return ThreadPoolExecutor(max_workers=8)
+
+
+def _speculate_next_turn(client, market, portfolio_return, turn):
+    """
+    Plays out the current turn on a COPY of the client with the speculative
+    decisions, then generates the next turn's market, message, and commentary.
+    Runs on a worker thread, so it must not touch st.session_state.
+    """
+    apply_recommendation(client, SPECULATIVE_RECOMMENDATION)
+    d_trust, d_anxiety, d_sat, d_eng, _ = calculate_full_turn_deltas(
+        client, SPECULATIVE_COMM_STYLE, SPECULATIVE_RECOMMENDATION, market, portfolio_return
+    )
+    client.apply_emotion_deltas(d_trust, d_anxiety, d_sat, d_eng)
+
+    next_market  = generate_market_turn()
+    next_return  = calculate_portfolio_return(client.portfolio, next_market)
+    next_context = get_scenario_context(client, next_market, next_return, turn + 1)
+    message, commentary = generate_turn_text_ai(next_context, next_market, next_return, client.name)
+
+    return {
+        "market":            next_market,
+        "portfolio_return":  next_return,
+        "context":           next_context,
+        "client_message":    message,
+        "market_commentary": commentary,
+    }
+
+
+def start_prefetch():
+    """Kicks off the speculative next turn once per turn (no-op if already running)."""
+    turn = st.session_state.turn
+    if st.session_state.get("prefetch", {}).get("turn") == turn:
+        return
+    future = _worker_pool().submit(
+        _speculate_next_turn,
+        copy.deepcopy(st.session_state.client),
+        st.session_state.market,
+        st.session_state.portfolio_return,
+        turn,
+    )
+    st.session_state.prefetch = {"turn": turn, "future": future}
+
+
+def take_prefetch(turn):
+    """
+    Returns the speculative next turn for `turn` if it has already finished, or None.
+    Never waits: if the guess is still in flight, Submit goes ahead without it
+    (the unfinished work is cancelled, or left to finish and warm the caches).
+    """
+    prefetch = st.session_state.pop("prefetch", None)
+    if not prefetch or prefetch["turn"] != turn:
+        return None
+    future = prefetch["future"]
+    if not future.done():
+        future.cancel()
+        return None
+    try:
+        return future.result()
+    except Exception:
+        return None
 
 
 # ─────────────────────────────────────────────
@@ -271,20 +939,22 @@ def init_game():
     st.session_state.turn              = 1
     st.session_state.portfolio_value   = 100_000.0
     st.session_state.log               = []
+    st.session_state.log_view          = deque()  # the same entries, newest first (every turn, no cap)
     st.session_state.market            = market
     st.session_state.portfolio_return  = port_return
     st.session_state.context           = context
-    st.session_state.client_message    = generate_client_message_ai(context)
-    st.session_state.market_commentary = generate_market_commentary_ai(market, port_return, client.name)
+    st.session_state.client_message    = None  # None = streamed in when the turn is first shown
+    st.session_state.market_commentary = None
     st.session_state.submitted         = False
     st.session_state.last_feedback     = None
     st.session_state.game_over         = False
-    st.session_state.started           = False
-    st.session_state.mode              = None  # "learning" or "simulation"
 
 
-if "client" not in st.session_state:
-    init_game()
+# The game itself is only set up once a mode is picked (see the Start buttons),
+# so just opening the page doesn't build a client or a market.
+if "started" not in st.session_state:
+    st.session_state.started = False
+    st.session_state.mode    = None  # "learning" or "simulation"
 
 
 # ─────────────────────────────────────────────
@@ -314,6 +984,7 @@ if not st.session_state.started:
         - Focus on understanding concepts
         """)
         if st.button("Start Learning Mode", use_container_width=True, type="primary"):
+            init_game()
             st.session_state.mode    = "learning"
             st.session_state.started = True
             st.rerun()
@@ -330,6 +1001,7 @@ if not st.session_state.started:
         - Mirrors real wealth management
         """)
         if st.button("Start Simulation Mode", use_container_width=True):
+            init_game()
             st.session_state.mode    = "simulation"
             st.session_state.started = True
             st.rerun()
@@ -369,38 +1041,38 @@ if st.session_state.game_over:
     # ── Four Score Components ──
     st.subheader("📐 Score Breakdown")
     st.caption("How your final score was calculated (with weights)")
-    c1, c2, c3, c4 = st.columns(4)
-    c1.metric("Portfolio Performance",  f"{breakdown['portfolio_score']}/100",
-              help="Did the client's money grow vs. benchmark? (25% of score)")
-    c2.metric("Client Relationship",    f"{breakdown['relationship_score']}/100",
-              help="Trust + Satisfaction + low Anxiety + Engagement (35% of score)")
-    c3.metric("Risk Management",        f"{breakdown['risk_score']}/100",
-              help="Consistency — avoiding panic moves (25% of score)")
-    c4.metric("Crisis Handling",        f"{breakdown['crisis_score']}/100",
-              help="Communication during bear markets and crises (15% of score)")
+    st.markdown(_md_table(
+        ("Portfolio Performance (25%)", "Client Relationship (35%)", "Risk Management (25%)", "Crisis Handling (15%)"),
+        [f"{breakdown[key]}/100" for key in ("portfolio_score", "relationship_score", "risk_score", "crisis_score")],
+    ))
+    st.caption(
+        "Portfolio: did the money grow vs. benchmark? · Relationship: trust + satisfaction + low anxiety + engagement · "
+        "Risk: consistency, avoiding panic moves · Crisis: communication during bear markets and crises"
+    )
 
     st.markdown("---")
 
     # ── Portfolio Results ──
     st.subheader("💰 Portfolio Results")
     gain_loss = final_value - 100_000
-    p1, p2, p3, p4 = st.columns(4)
-    p1.metric("Starting Value", "$100,000")
-    p2.metric("Final Value",    f"${final_value:,.0f}", delta=f"${gain_loss:,.0f}")
-    p3.metric("Your Return",    f"{breakdown['total_return_pct']}%")
-    p4.metric("Benchmark",      f"{breakdown['benchmark_pct']}%",
-              help="Simple 5%/year benchmark. Real advisors are compared against the S&P 500.")
+    # "\$" — a bare $ in markdown starts inline math, and this row has several
+    gain_text = f":{'green' if gain_loss >= 0 else 'red'}[{'+' if gain_loss >= 0 else '-'}\\${abs(gain_loss):,.0f}]"
+    st.markdown(_md_table(
+        ("Starting Value", "Final Value", "Your Return", "Benchmark"),
+        ("\\$100,000", f"\\${final_value:,.0f} ({gain_text})",
+         f"{breakdown['total_return_pct']}%", f"{breakdown['benchmark_pct']}%"),
+    ))
+    st.caption("Benchmark: a simple 5%/year. Real advisors are compared against the S&P 500.")
 
     st.markdown("---")
 
     # ── Client Final State ──
     st.subheader(f"🤝 Final Client Relationship — {client.name}")
     st.markdown(f"**Status: {client.status_label()}**")
-    e1, e2, e3, e4 = st.columns(4)
-    e1.metric("Trust",        int(client.trust))
-    e2.metric("Anxiety",      int(client.anxiety))
-    e3.metric("Satisfaction", int(client.satisfaction))
-    e4.metric("Engagement",   int(client.engagement))
+    st.markdown(_md_table(
+        EMOTION_LABELS,
+        [str(int(getattr(client, key))) for _, key, _ in EMOTION_COLUMNS],
+    ))
 
     st.markdown("---")
 
@@ -424,24 +1096,329 @@ if st.session_state.game_over:
         crisis_regimes = ["Bear Market", "Market Crisis", "Rate Shock"]
         crisis_count = sum(1 for e in log if e["regime"] in crisis_regimes)
         st.caption(f"Crisis periods: {crisis_count} | Panic moves: {breakdown['panic_moves']}")
-        for entry in log:
-            chg = entry["emotional_changes"]
-            st.markdown(
-                f"**Turn {entry['turn']}** | {entry['regime']} | "
-                f"Return: {fmt_pct(entry['portfolio_return'])} | "
-                f"Value: ${entry['portfolio_value']:,.0f} | "
-                f"Trust {'+' if chg['trust'] >= 0 else ''}{chg['trust']} | "
-                f"Anxiety {'+' if chg['anxiety'] >= 0 else ''}{chg['anxiety']}"
-            )
+        st.markdown(_log_markdown(log))
 
     if st.button("🔄 Start New Simulation", type="primary"):
-        for key in list(st.session_state.keys()):
-            del st.session_state[key]
+        st.session_state.clear()
         st.rerun()
 
     st.stop()
 
 
+# ─────────────────────────────────────────────
+# DECISIONS PANEL + TURN SUBMISSION
+# ─────────────────────────────────────────────
+# The decisions panel is a FRAGMENT: when the user changes a dropdown or types,
+# Streamlit reruns only this function instead of the whole page.
+# A full-page rerun happens only when the turn is actually submitted.
+
+def submit_turn(comm_style, recommendation, free_text):
+    """Applies the advisor's decisions, logs the turn, and sets up the next one."""
+    client   = st.session_state.client
+    market   = st.session_state.market
+    port_ret = st.session_state.portfolio_return
+
+    st.session_state.portfolio_value *= (1 + port_ret)
+    apply_recommendation(client, recommendation)
+
+    d_trust, d_anxiety, d_sat, d_eng, breakdown = calculate_full_turn_deltas(
+        client, comm_style, recommendation, market, port_ret
+    )
+
+    # The next market doesn't depend on our decisions, so a prefetched one is always usable.
+    # The prefetched text is only reused if the speculation produced the exact same inputs.
+    # On the final turn there is no next turn, so none of this is set up.
+    final_turn      = st.session_state.turn >= 10
+    pending_streams = {}
+    if not final_turn:
+        spec         = take_prefetch(st.session_state.turn)
+        new_market   = spec["market"] if spec else generate_market_turn()
+        new_port_ret = calculate_portfolio_return(client.portfolio, new_market)
+
+        commentary_hit = spec is not None and spec["portfolio_return"] == new_port_ret
+        if not commentary_hit:
+            pending_streams["market_commentary"] = stream_market_commentary_ai(new_market, new_port_ret, client.name)
+
+    # The commentary stream (if any) is already running on the event loop, so the
+    # grade call below overlaps with it. The grade is made here, not on a worker
+    # thread, so it can never queue behind another session's prefetch.
+    # (The next client MESSAGE depends on the grade — it changes how the client
+    # feels — so that one has to wait.)
+    text_grades = None
+    if free_text and len(free_text.strip()) >= 10:
+        text_grades = grade_free_text_ai(free_text, st.session_state.context, st.session_state.context["intent"])
+    if text_grades:
+        d_trust   += text_grades["d_trust"]
+        d_anxiety += text_grades["d_anxiety"]
+        d_sat     += text_grades["d_satisfaction"]
+        breakdown.append(("written", text_grades["feedback"]))
+
+    actual_changes = client.apply_emotion_deltas(d_trust, d_anxiety, d_sat, d_eng)
+    breakdown      = _format_breakdown(breakdown)
+
+    st.session_state.last_feedback = {
+        "breakdown":      breakdown,
+        "changes":        actual_changes,
+        "comm_style":     comm_style,
+        "recommendation": recommendation,
+        "new_allocation": dict(client.portfolio),
+        "text_grades":    text_grades,
+        # Built once here, not on every rerun while the panel is open
+        "breakdown_md":   "\n".join(f"- {item}" for item in breakdown),
+        "changes_md":     _changes_table(actual_changes),
+        "grades_md":      _grades_table(text_grades) if text_grades else None,
+        "alloc_caption":  (
+            f"New allocation: {client.portfolio['stocks']*100:.0f}% stocks / "
+            f"{client.portfolio['bonds']*100:.0f}% bonds / {client.portfolio['cash']*100:.0f}% cash"
+        ),
+    }
+
+    entry = {
+        "turn":              st.session_state.turn,
+        "regime":            market["regime"],
+        "portfolio_return":  port_ret,
+        "portfolio_value":   st.session_state.portfolio_value,
+        "comm_style":        comm_style,
+        "recommendation":    recommendation,
+        "emotional_changes": actual_changes,
+    }
+    # Formatted once here; the turn history and the session log just print it
+    entry["display_line"] = _format_log_line(entry)
+    st.session_state.log.append(entry)
+    st.session_state.log_view.appendleft(entry)
+
+    if final_turn or client.trust < 15 or client.engagement < 10:
+        st.session_state.game_over = True
+        return
+
+    st.session_state.turn += 1
+    new_context = get_scenario_context(client, new_market, new_port_ret, st.session_state.turn)
+
+    # Anything the speculation missed is left as None and streamed in on the next render
+    message_hit = spec is not None and spec["context"] == new_context
+
+    st.session_state.pending_streams   = pending_streams
+    st.session_state.market            = new_market
+    st.session_state.portfolio_return  = new_port_ret
+    st.session_state.context           = new_context
+    st.session_state.client_message    = spec["client_message"]    if message_hit    else None
+    st.session_state.market_commentary = spec["market_commentary"] if commentary_hit else None
+    st.session_state.submitted         = False
+
+
+# The dropdown labels below are recomputed for every option on every render;
+# their inputs are a handful of keys and allocations, so results are memoized.
+@lru_cache(maxsize=None)
+def _comm_style_preview(key):
+    """Dropdown label for learning mode: the option plus what it does to the client."""
+    effect = COMM_STYLE_EFFECTS[key]
+    if "Dismissive" in key:
+        return f"{key}  ·  ⚠️ almost always damages the relationship"
+    return f"{key}  ·  trust {effect['d_trust']:+d}, anxiety {effect['d_anxiety']:+d}"
+
+
+@lru_cache(maxsize=256)
+def _recommendation_preview(key, current_stocks):
+    """Dropdown label showing where the stock allocation would end up."""
+    shift = RECOMMENDATION_EFFECTS[key]["stock_shift"]
+    if shift == 0:
+        return key
+    new_stocks = clamp(current_stocks + shift, 0, 1)
+    return f"{key}  ·  stocks {current_stocks*100:.0f}% → ~{new_stocks*100:.0f}%"
+
+
+@st.fragment
+def decisions_panel(mode, quick_turn):
+    """
+    Communication style, recommendation, written response, and the Submit/End buttons.
+
+    The inputs sit inside an st.form, so picking options and typing doesn't
+    rerun anything — all the values are sent together when a button is pressed.
+    Because nothing reruns before that, the "what would this do" previews are
+    built into the dropdown labels instead of captions underneath.
+    """
+    client = st.session_state.client
+    current_stocks = client.portfolio["stocks"]
+
+    with st.form("turn_form", border=False):
+        if mode == "learning":
+            st.markdown("### 🎯 Your Response")
+
+            comm_style = st.selectbox(
+                "How will you respond to them emotionally?",
+                list(COMM_STYLE_EFFECTS.keys()),
+                format_func=_comm_style_preview,
+                help="This affects how much your client trusts you and how anxious they feel."
+            )
+
+            recommendation = st.selectbox(
+                "What will you do with their portfolio?",
+                list(RECOMMENDATION_EFFECTS.keys()),
+                format_func=lambda key: _recommendation_preview(key, current_stocks),
+                help="This changes the actual mix of stocks, bonds, and cash."
+            )
+
+            # Simplified text area with guiding prompt
+            free_text = st.text_area(
+                "Write what you'd say to your client (optional but earns bonus points):",
+                height=100,
+                placeholder=f"Try: 'I understand this is stressful. Markets like this are temporary, and your portfolio is built for your goal of {client.goal}. Let's stay the course...'"
+            )
+
+            # Current allocation (collapsed by default in learning mode)
+            with st.expander("📂 View current portfolio allocation", expanded=False):
+                a1, a2, a3 = st.columns(3)
+                a1.metric("Stocks", f"{client.portfolio['stocks']*100:.0f}%", help="Higher risk, higher potential return")
+                a2.metric("Bonds",  f"{client.portfolio['bonds']*100:.0f}%",  help="Lower risk, steady income")
+                a3.metric("Cash",   f"{client.portfolio['cash']*100:.0f}%",   help="Safest, but lowest return")
+                lo, hi = RISK_STOCK_RANGES[client.risk_tolerance]
+                st.caption(f"Recommended stock range for {client.risk_tolerance} risk tolerance: {int(lo*100)}%–{int(hi*100)}%")
+
+            submit_label, end_label = "✅ Submit & Move Forward 6 Months", "🏁 End & See Score"
+
+        else:
+            st.subheader("🎯 Your Decisions")
+
+            comm_style = st.selectbox(
+                "**Communication approach**",
+                list(COMM_STYLE_EFFECTS.keys()),
+                help="Your communication style affects trust and anxiety more than almost anything else."
+            )
+
+            recommendation = st.selectbox(
+                "**Recommendation**",
+                list(RECOMMENDATION_EFFECTS.keys()),
+                format_func=lambda key: _recommendation_preview(key, current_stocks),
+                help="This changes the actual portfolio allocation."
+            )
+
+            # Free text only shown in full turn mode
+            free_text = ""
+            if not quick_turn:
+                free_text = st.text_area(
+                    "**Your message to the client** *(optional — graded by AI)*",
+                    height=100,
+                    placeholder="e.g. 'I understand your concern. Markets like this are uncomfortable but historically temporary...'"
+                )
+
+            submit_label, end_label = "✅ Submit & Advance 6 Months", "🏁 End Simulation"
+
+        col_submit, col_end = st.columns([2, 1])
+        with col_submit:
+            submit_btn = st.form_submit_button(submit_label, type="primary", use_container_width=True)
+        with col_end:
+            end_btn = st.form_submit_button(end_label, use_container_width=True)
+
+    if end_btn:
+        st.session_state.game_over = True
+        st.rerun(scope="app")
+
+    if submit_btn:
+        submit_turn(comm_style, recommendation, free_text)
+        st.rerun(scope="app")
+
+
+# ─────────────────────────────────────────────
+# MAIN SCREEN PIECES
+# ─────────────────────────────────────────────
+# Both modes show the same four things — market, feelings, message, decisions —
+# just with different amounts of detail. Each piece is drawn by one function
+# that checks `mode` only where the two layouts actually differ.
+
+def _render_market_card(mode, card, ai_streams, quick_turn):
+    """The market this period, the portfolio result, and the AI commentary."""
+    if mode == "learning":
+        st.markdown(card["learning_heading"])
+        st.caption(card["description"])
+
+        m1, m2 = st.columns(2)
+        m1.metric("Your Portfolio Return", card["portfolio"],
+                  help="This is how much your client's portfolio gained or lost this period")
+        m2.metric("Portfolio Value", f"${st.session_state.portfolio_value:,.0f}",
+                  help="Total value of your client's investments")
+
+        # Learning tip
+        show_ai_text("market_commentary", ai_streams, "info", "💡 **What's happening:** ")
+        return
+
+    st.subheader("📊 Market This Period")
+    st.markdown(card["sim_heading"])
+    st.caption(card["description"])
+
+    ret_cols = st.columns(3)
+    ret_cols[0].metric("Stocks", card["stocks"])
+    ret_cols[1].metric("Bonds",  card["bonds"])
+    ret_cols[2].metric("Cash",   card["cash"])
+
+    st.markdown("---")
+    port_cols = st.columns(2)
+    port_cols[0].metric("Portfolio Return", card["portfolio"])
+    port_cols[1].metric("Portfolio Value",  f"${st.session_state.portfolio_value:,.0f}")
+
+    # Market commentary (collapsed in quick turn)
+    if not quick_turn:
+        show_ai_text("market_commentary", ai_streams, "info", "📚 **Market Context:** ")
+
+
+def _render_emotion_state(mode, client, quick_turn):
+    """Trust / anxiety / satisfaction: plain bars in learning mode, numbers (+ bars) in simulation."""
+    trust, anxiety, satisfaction = int(client.trust), int(client.anxiety), int(client.satisfaction)
+    if mode == "learning":
+        st.markdown("### 🧠 How Your Client is Feeling")
+        st.caption("These change based on your decisions. Keep trust high and anxiety low.")
+    else:
+        st.subheader("🧠 Client Emotional State")
+        em_cols = st.columns(4)
+        em_cols[0].metric("Anxiety",      anxiety)
+        em_cols[1].metric("Trust",        trust)
+        em_cols[2].metric("Satisfaction", satisfaction)
+        em_cols[3].metric("Engagement",   int(client.engagement))
+
+    if not quick_turn:
+        st.markdown(_fmt_emotion_progress(trust, anxiety, satisfaction)[mode], unsafe_allow_html=True)
+
+
+def _render_client_message(mode, client, ai_streams):
+    """This turn's message from the client."""
+    if mode == "learning":
+        st.markdown(f"### 💬 Message from {client.name}")
+    else:
+        st.subheader(f"💬 Message from {client.name}")
+    show_ai_text("client_message", ai_streams, "warning")
+
+
+@st.fragment
+def _render_feedback(mode):
+    """
+    The "Last Turn Outcome" panel.
+    A fragment, like the decisions panel, so it is its own unit of redrawing:
+    its contents only change when a turn is submitted, and a Submit reruns the
+    whole page anyway.
+    """
+    fb = st.session_state.last_feedback
+    with st.expander("📋 Last Turn Outcome", expanded=True):
+
+        if mode == "simulation":
+            st.markdown(fb["breakdown_md"])
+
+        # Heading and table go out as ONE element each — the page cost is per element
+        st.markdown(f"**Emotional Changes:**\n\n{fb['changes_md']}")
+
+        if fb.get("text_grades"):
+            tg = fb["text_grades"]
+            st.markdown(f"**✍️ Written Response Grade:** *(each scored -2 to +2)*\n\n{fb['grades_md']}")
+            st.caption(f"💬 {tg['feedback']}")
+
+        st.caption(fb["alloc_caption"])
+
+
+@st.fragment
+def _render_history():
+    """The collapsed list of past turns, newest first (a fragment for the same reason)."""
+    with st.expander("📜 Turn History", expanded=False):
+        st.markdown(_log_markdown(st.session_state.log_view))
+
+
 # ─────────────────────────────────────────────
 # MAIN GAME SCREEN
 # ─────────────────────────────────────────────
@@ -451,6 +1428,22 @@ market   = st.session_state.market
 port_ret = st.session_state.portfolio_return
 mode     = st.session_state.mode  # "learning" or "simulation"
 
+# Start streaming any AI text that isn't ready yet (both requests run at the same time).
+# submit_turn may already have started one of them. The streams are kept in
+# session_state while they are drawn: if a click reruns the page halfway through,
+# the next run finishes the same reply rather than sending the request again.
+ai_streams = st.session_state.setdefault("pending_streams", {})
+if st.session_state.client_message is None and "client_message" not in ai_streams:
+    ai_streams["client_message"] = stream_client_message_ai(st.session_state.context)
+if st.session_state.market_commentary is None and "market_commentary" not in ai_streams:
+    ai_streams["market_commentary"] = stream_market_commentary_ai(market, port_ret, client.name)
+
+# Per-turn labels (formatted once, then served from the cache on every rerun)
+card = _fmt_market_card(
+    market["regime"], market["description"],
+    market["stock_return"], market["bond_return"], market["cash_return"], round(port_ret, 4),
+)
+
 # ── Header ───────────────────────────────────
 col_title, col_status = st.columns([3, 1])
 with col_title:
@@ -475,85 +1468,15 @@ if mode == "learning":
     st.markdown(f"**Goal:** {client.goal} &nbsp;|&nbsp; **Risk Tolerance:** {client.risk_tolerance.upper()}")
     st.markdown("---")
 
-    # ── Market Summary (simple) ──
-    regime_colors = {"Bull Market":"🟢","Bear Market":"🔴","Market Crisis":"🚨","Recovery":"🔵","Sideways / Flat":"🟡","Rate Shock":"🟠"}
-    regime_icon = regime_colors.get(market["regime"], "⚪")
-    st.markdown(f"### {regime_icon} Market This Period: {market['regime']}")
-    st.caption(market["description"])
-
-    m1, m2 = st.columns(2)
-    m1.metric("Your Portfolio Return", fmt_pct(port_ret),
-              help="This is how much your client's portfolio gained or lost this period")
-    m2.metric("Portfolio Value", f"${st.session_state.portfolio_value:,.0f}",
-              help="Total value of your client's investments")
-
-    # Learning tip
-    st.info(f"💡 **What's happening:** {st.session_state.market_commentary}")
-
+    _render_market_card(mode, card, ai_streams, quick_turn=False)
     st.markdown("---")
-
-    # ── Emotional State (simple bars, plain labels) ──
-    st.markdown("### 🧠 How Your Client is Feeling")
-    st.caption("These change based on your decisions. Keep trust high and anxiety low.")
-
-    st.progress(int(client.trust) / 100,        text=f"Trust: {int(client.trust)}/100 — {'High ✅' if client.trust > 60 else 'Low ⚠️'}")
-    st.progress(int(client.anxiety) / 100,      text=f"Anxiety: {int(client.anxiety)}/100 — {'High ⚠️' if client.anxiety > 60 else 'Normal ✅'}")
-    st.progress(int(client.satisfaction) / 100, text=f"Satisfaction: {int(client.satisfaction)}/100")
-
+    _render_emotion_state(mode, client, quick_turn=False)
     st.markdown("---")
-
-    # ── Client Message ──
-    st.markdown(f"### 💬 Message from {client.name}")
-    st.warning(st.session_state.client_message)
-
+    _render_client_message(mode, client, ai_streams)
     st.markdown("---")
 
     # ── Decisions (with plain explanations) ──
-    st.markdown("### 🎯 Your Response")
-
-    comm_style = st.selectbox(
-        "How will you respond to them emotionally?",
-        list(COMM_STYLE_EFFECTS.keys()),
-        help="This affects how much your client trusts you and how anxious they feel."
-    )
-    # Plain English explanation of what this choice does
-    effect_preview = COMM_STYLE_EFFECTS[comm_style]
-    if "Dismissive" in comm_style:
-        st.caption("⚠️ Warning: Dismissing client concerns almost always damages the relationship.")
-    else:
-        st.caption(f"→ Trust change: {'+' if effect_preview['d_trust'] >= 0 else ''}{effect_preview['d_trust']} | Anxiety change: {'+' if effect_preview['d_anxiety'] >= 0 else ''}{effect_preview['d_anxiety']}")
-
-    recommendation = st.selectbox(
-        "What will you do with their portfolio?",
-        list(RECOMMENDATION_EFFECTS.keys()),
-        help="This changes the actual mix of stocks, bonds, and cash."
-    )
-    rec_effect = RECOMMENDATION_EFFECTS[recommendation]
-    if rec_effect["stock_shift"] != 0:
-        new_stocks = clamp(client.portfolio["stocks"] + rec_effect["stock_shift"], 0, 1)
-        st.caption(f"→ Stocks would go from {client.portfolio['stocks']*100:.0f}% to ~{new_stocks*100:.0f}%")
-
-    # Simplified text area with guiding prompt
-    free_text = st.text_area(
-        "Write what you'd say to your client (optional but earns bonus points):",
-        height=100,
-        placeholder=f"Try: 'I understand this is stressful. Markets like this are temporary, and your portfolio is built for your goal of {client.goal}. Let's stay the course...'"
-    )
-
-    # Current allocation (collapsed by default in learning mode)
-    with st.expander("📂 View current portfolio allocation", expanded=False):
-        a1, a2, a3 = st.columns(3)
-        a1.metric("Stocks", f"{client.portfolio['stocks']*100:.0f}%", help="Higher risk, higher potential return")
-        a2.metric("Bonds",  f"{client.portfolio['bonds']*100:.0f}%",  help="Lower risk, steady income")
-        a3.metric("Cash",   f"{client.portfolio['cash']*100:.0f}%",   help="Safest, but lowest return")
-        lo, hi = (0.10,0.40) if client.risk_tolerance=="low" else (0.40,0.70) if client.risk_tolerance=="medium" else (0.70,0.95)
-        st.caption(f"Recommended stock range for {client.risk_tolerance} risk tolerance: {int(lo*100)}%–{int(hi*100)}%")
-
-    col_submit, col_end = st.columns([2, 1])
-    with col_submit:
-        submit_btn = st.button("✅ Submit & Move Forward 6 Months", type="primary", use_container_width=True)
-    with col_end:
-        end_btn = st.button("🏁 End & See Score", use_container_width=True)
+    decisions_panel(mode, quick_turn=False)
 
 # ═══════════════════════════════════════════════════
 # SIMULATION MODE LAYOUT
@@ -573,26 +1496,7 @@ else:
             st.markdown(f"**Risk Tolerance:** {client.risk_tolerance.upper()}")
             st.caption(f"Loss Aversion: {client.loss_aversion} | Trust Propensity: {client.trust_propensity} | Control Preference: {client.control_preference}")
 
-        # Market (always open)
-        st.subheader("📊 Market This Period")
-        regime_colors = {"Bull Market":"🟢","Bear Market":"🔴","Market Crisis":"🚨","Recovery":"🔵","Sideways / Flat":"🟡","Rate Shock":"🟠"}
-        regime_icon = regime_colors.get(market["regime"], "⚪")
-        st.markdown(f"### {regime_icon} {market['regime']}")
-        st.caption(market["description"])
-
-        ret_cols = st.columns(3)
-        ret_cols[0].metric("Stocks", fmt_pct(market["stock_return"]))
-        ret_cols[1].metric("Bonds",  fmt_pct(market["bond_return"]))
-        ret_cols[2].metric("Cash",   fmt_pct(market["cash_return"]))
-
-        st.markdown("---")
-        port_cols = st.columns(2)
-        port_cols[0].metric("Portfolio Return", fmt_pct(port_ret))
-        port_cols[1].metric("Portfolio Value",  f"${st.session_state.portfolio_value:,.0f}")
-
-        # Market commentary (collapsed in quick turn)
-        if not quick_turn:
-            st.info(f"📚 **Market Context:** {st.session_state.market_commentary}")
+        _render_market_card(mode, card, ai_streams, quick_turn)
 
         # Allocation (always visible in sim mode)
         st.markdown("---")
@@ -603,174 +1507,26 @@ else:
             alloc_cols[2].metric("Cash",   f"{client.portfolio['cash']*100:.0f}%")
 
     with right_col:
-        # Emotional state (always open)
-        st.subheader("🧠 Client Emotional State")
-        em_cols = st.columns(4)
-        em_cols[0].metric("Anxiety",      int(client.anxiety))
-        em_cols[1].metric("Trust",        int(client.trust))
-        em_cols[2].metric("Satisfaction", int(client.satisfaction))
-        em_cols[3].metric("Engagement",   int(client.engagement))
-
-        if not quick_turn:
-            for label, value, _ in [("Trust", client.trust, True), ("Anxiety", client.anxiety, False), ("Satisfaction", client.satisfaction, True)]:
-                st.progress(int(value) / 100, text=f"{label}: {int(value)}/100")
-
+        _render_emotion_state(mode, client, quick_turn)
         st.markdown("---")
-
-        # Client message (always open)
-        st.subheader(f"💬 Message from {client.name}")
-        st.warning(st.session_state.client_message)
-
+        _render_client_message(mode, client, ai_streams)
         st.markdown("---")
 
         # Decisions
-        st.subheader("🎯 Your Decisions")
-
-        comm_style = st.selectbox(
-            "**Communication approach**",
-            list(COMM_STYLE_EFFECTS.keys()),
-            help="Your communication style affects trust and anxiety more than almost anything else."
-        )
-
-        recommendation = st.selectbox(
-            "**Recommendation**",
-            list(RECOMMENDATION_EFFECTS.keys()),
-            help="This changes the actual portfolio allocation."
-        )
-
-        rec_effect = RECOMMENDATION_EFFECTS[recommendation]
-        if rec_effect["stock_shift"] != 0:
-            new_stocks = clamp(client.portfolio["stocks"] + rec_effect["stock_shift"], 0, 1)
-            st.caption(f"→ Stocks: {client.portfolio['stocks']*100:.0f}% → ~{new_stocks*100:.0f}%")
-
-        # Free text only shown in full turn mode
-        free_text = ""
-        if not quick_turn:
-            free_text = st.text_area(
-                "**Your message to the client** *(optional — graded by AI)*",
-                height=100,
-                placeholder="e.g. 'I understand your concern. Markets like this are uncomfortable but historically temporary...'"
-            )
-
-        col_submit, col_end = st.columns([2, 1])
-        with col_submit:
-            submit_btn = st.button("✅ Submit & Advance 6 Months", type="primary", use_container_width=True)
-        with col_end:
-            end_btn = st.button("🏁 End Simulation", use_container_width=True)
-
-# ═══════════════════════════════════════════════════
-# SHARED SUBMIT LOGIC (runs for both modes)
-# ═══════════════════════════════════════════════════
-
-if end_btn:
-    st.session_state.game_over = True
-    st.rerun()
-
-if submit_btn:
-    st.session_state.portfolio_value *= (1 + port_ret)
-    apply_recommendation(client, recommendation)
-
-    d_trust, d_anxiety, d_sat, d_eng, breakdown = calculate_full_turn_deltas(
-        client, comm_style, recommendation, market, port_ret
-    )
-
-    text_grades = None
-    if free_text and len(free_text.strip()) >= 10:
-        text_grades = grade_free_text_ai(
-            free_text,
-            st.session_state.context,
-            st.session_state.context["intent"]
-        )
-        if text_grades:
-            d_trust   += text_grades["d_trust"]
-            d_anxiety += text_grades["d_anxiety"]
-            d_sat     += text_grades["d_satisfaction"]
-            breakdown.append(f"✍️ Written response: {text_grades['feedback']}")
-
-    actual_changes = client.apply_emotion_deltas(d_trust, d_anxiety, d_sat, d_eng)
-
-    st.session_state.last_feedback = {
-        "breakdown":      breakdown,
-        "changes":        actual_changes,
-        "comm_style":     comm_style,
-        "recommendation": recommendation,
-        "new_allocation": dict(client.portfolio),
-        "text_grades":    text_grades,
-    }
-
-    st.session_state.log.append({
-        "turn":              st.session_state.turn,
-        "regime":            market["regime"],
-        "portfolio_return":  port_ret,
-        "portfolio_value":   st.session_state.portfolio_value,
-        "comm_style":        comm_style,
-        "recommendation":    recommendation,
-        "emotional_changes": actual_changes,
-    })
-
-    if st.session_state.turn >= 10 or client.trust < 15 or client.engagement < 10:
-        st.session_state.game_over = True
-        st.rerun()
-
-    st.session_state.turn += 1
-    new_market   = generate_market_turn()
-    new_port_ret = calculate_portfolio_return(client.portfolio, new_market)
-    new_context  = get_scenario_context(client, new_market, new_port_ret, st.session_state.turn)
-
-    st.session_state.market            = new_market
-    st.session_state.portfolio_return  = new_port_ret
-    st.session_state.context           = new_context
-    st.session_state.client_message    = generate_client_message_ai(new_context)
-    st.session_state.market_commentary = generate_market_commentary_ai(new_market, new_port_ret, client.name)
-    st.session_state.submitted         = False
-    st.rerun()
+        decisions_panel(mode, quick_turn)
 
 # ── Feedback Panel ──
 if st.session_state.last_feedback:
-    fb = st.session_state.last_feedback
-    with st.expander("📋 Last Turn Outcome", expanded=True):
-
-        if mode == "simulation":
-            for item in fb["breakdown"]:
-                st.markdown(f"- {item}")
-
-        st.markdown("**Emotional Changes:**")
-        change_cols = st.columns(4)
-        labels         = ["Trust", "Anxiety", "Satisfaction", "Engagement"]
-        keys           = ["trust", "anxiety", "satisfaction", "engagement"]
-        good_direction = [1, -1, 1, 1]
-
-        for i, (label, key, good) in enumerate(zip(labels, keys, good_direction)):
-            val = fb["changes"][key]
-            if val == 0:
-                change_cols[i].metric(label, "±0")
-            elif val * good > 0:
-                change_cols[i].metric(label, f"+{val}" if val > 0 else str(val), delta=str(val))
-            else:
-                change_cols[i].metric(label, f"+{val}" if val > 0 else str(val), delta=str(val), delta_color="inverse")
-
-        if fb.get("text_grades"):
-            tg = fb["text_grades"]
-            st.markdown("**✍️ Written Response Grade:**")
-            g_cols = st.columns(4)
-            g_cols[0].metric("Empathy",        tg["empathy"],         help="-2 to +2")
-            g_cols[1].metric("Clarity",         tg["clarity"],         help="-2 to +2")
-            g_cols[2].metric("Goal Alignment",  tg["alignment"],       help="-2 to +2")
-            g_cols[3].metric("Professionalism", tg["professionalism"], help="-2 to +2")
-            st.caption(f"💬 {tg['feedback']}")
-
-        new_alloc = fb["new_allocation"]
-        st.caption(f"New allocation: {new_alloc['stocks']*100:.0f}% stocks / {new_alloc['bonds']*100:.0f}% bonds / {new_alloc['cash']*100:.0f}% cash")
+    _render_feedback(mode)
 
 # ── Turn History (always collapsed) ──
 if st.session_state.log:
-    with st.expander("📜 Turn History", expanded=False):
-        for entry in reversed(st.session_state.log):
-            chg = entry["emotional_changes"]
-            st.markdown(
-                f"**Turn {entry['turn']}** | {entry['regime']} | "
-                f"Return: {fmt_pct(entry['portfolio_return'])} | "
-                f"Value: ${entry['portfolio_value']:,.0f} | "
-                f"Trust {'+' if chg['trust'] >= 0 else ''}{chg['trust']} | "
-                f"Anxiety {'+' if chg['anxiety'] >= 0 else ''}{chg['anxiety']}"
-            )
+    _render_history()
+
+# Text this layout didn't show (e.g. Quick Turn hides the commentary) stays in
+# pending_streams. Never wait for it here: the request keeps running, and
+# whichever rerun first displays it picks it up from the queue.
+
+# ── Prefetch the next turn while the user reads and decides ──
+if st.session_state.turn < 10:
+    start_prefetch()
@@ -13,6 +13,8 @@ Keeping them separate is good coding practice.
 
 import random
 
+import numpy as np
+
 
 # ─────────────────────────────────────────────
 # UTILITY FUNCTIONS
@@ -28,9 +30,8 @@ def clamp(value, minimum, maximum):
 
 
 def fmt_pct(decimal):
-    """Converts 0.12 → '+12.00%' and -0.05 → '-5.00%'"""
-    sign = "+" if decimal >= 0 else ""
-    return f"{sign}{decimal * 100:.1f}%"
+    """Converts 0.12 → '+12.0%' and -0.05 → '-5.0%'"""
+    return f"{decimal * 100:+.1f}%"  # the + in the format adds the sign for us
 
 
 # ─────────────────────────────────────────────
@@ -48,6 +49,19 @@ class Client:
     These are how the client is feeling right now.
     """
 
+    # PROGRAMMING CONCEPT: __slots__ lists every attribute up front, so Python
+    # stores them in fixed slots instead of a per-object dict. Each Client is
+    # smaller and attribute reads are a little faster — handy when simulating
+    # many clients at once. (Adding a new attribute means adding it here too.)
+    __slots__ = (
+        "loss_aversion", "trust_propensity", "control_preference", "recency_bias",
+        "risk_tolerance", "name", "goal",
+        "anxiety", "trust", "satisfaction", "engagement",
+        "portfolio",
+        "_trust_mult", "_anxiety_mult",
+        "_adherence_cache", "_status_cache",
+    )
+
     # Name pool for variety
     NAMES = ["Michael", "Sofia", "Jordan", "Ava", "Ethan", "Maya", "Carlos", "Priya"]
 
@@ -60,42 +74,51 @@ class Client:
         "achieving financial independence",
     ]
 
-    def __init__(self):
+    def __init__(self, seed=None):
+        # Each client rolls its own dice. The same seed always gives the same
+        # client, and simulations running side by side don't share one generator.
+        rng = random.Random(seed)
+
         # ── Fixed Personality Traits (0–100 scale) ──────────────
         # These are rolled once and stay fixed — like a real person's personality
 
-        self.loss_aversion = random.randint(40, 90)
+        self.loss_aversion = rng.randint(40, 90)
         # How badly losses feel. High = panics more during downturns.
 
-        self.trust_propensity = random.randint(30, 75)
+        self.trust_propensity = rng.randint(30, 75)
         # How quickly they trust an advisor. High = trust builds faster.
 
-        self.control_preference = random.randint(20, 80)
+        self.control_preference = rng.randint(20, 80)
         # How much they want to make their own decisions. High = harder to advise.
 
-        self.recency_bias = random.randint(30, 85)
+        self.recency_bias = rng.randint(30, 85)
         # Tendency to overweight recent events. High = chases returns, panics on losses.
 
+        # How strongly these traits scale each turn's feelings (see calculate_full_turn_deltas).
+        # The traits never change, so the multipliers are worked out once here.
+        self._trust_mult   = 0.75 + (self.trust_propensity / 100) * 0.5   # 0.75 to 1.25
+        self._anxiety_mult = 0.75 + (self.loss_aversion    / 100) * 0.6   # 0.75 to 1.35
+
         # ── Risk Profile ─────────────────────────────────────────
-        self.risk_tolerance = random.choice(["low", "medium", "high"])
+        self.risk_tolerance = rng.choice(["low", "medium", "high"])
 
         # ── Identity ─────────────────────────────────────────────
-        self.name = random.choice(self.NAMES)
-        self.goal = random.choice(self.GOALS)
+        self.name = rng.choice(self.NAMES)
+        self.goal = rng.choice(self.GOALS)
 
         # ── Dynamic Emotional State (0–100 scale) ────────────────
         # These change every turn based on what you do
 
-        self.anxiety = random.randint(30, 50)
+        self.anxiety = rng.randint(30, 50)
         # How stressed the client is. High anxiety → poor decisions, lower trust.
 
-        self.trust = random.randint(45, 65)
+        self.trust = rng.randint(45, 65)
         # How much they trust you. High trust → they follow your advice.
 
-        self.satisfaction = random.randint(45, 65)
+        self.satisfaction = rng.randint(45, 65)
         # Overall happiness with you as their advisor.
 
-        self.engagement = random.randint(50, 70)
+        self.engagement = rng.randint(50, 70)
         # How involved and interested they are. Low → might leave.
 
         # ── Portfolio Allocation ──────────────────────────────────
@@ -106,49 +129,58 @@ class Client:
             "cash":   0.05,
         }
 
+        # adherence_score() and status_label() only depend on the emotional state,
+        # so their answers are kept until apply_emotion_deltas changes it
+        self._adherence_cache = None
+        self._status_cache    = None
+
     def apply_emotion_deltas(self, d_trust, d_anxiety, d_satisfaction, d_engagement):
         """
         Apply emotional changes after a turn.
         Clamps everything between 0 and 100.
         Returns a dict showing what actually changed (for display).
         """
-        old = {
-            "trust": self.trust,
-            "anxiety": self.anxiety,
-            "satisfaction": self.satisfaction,
-            "engagement": self.engagement,
-        }
-
-        self.trust        = clamp(self.trust        + d_trust,        0, 100)
-        self.anxiety      = clamp(self.anxiety      + d_anxiety,      0, 100)
-        self.satisfaction = clamp(self.satisfaction + d_satisfaction, 0, 100)
-        self.engagement   = clamp(self.engagement   + d_engagement,   0, 100)
-
-        return {
-            "trust":        self.trust        - old["trust"],
-            "anxiety":      self.anxiety      - old["anxiety"],
-            "satisfaction": self.satisfaction - old["satisfaction"],
-            "engagement":   self.engagement   - old["engagement"],
+        trust        = max(0, min(100, self.trust        + d_trust))
+        anxiety      = max(0, min(100, self.anxiety      + d_anxiety))
+        satisfaction = max(0, min(100, self.satisfaction + d_satisfaction))
+        engagement   = max(0, min(100, self.engagement   + d_engagement))
+
+        changes = {
+            "trust":        trust        - self.trust,
+            "anxiety":      anxiety      - self.anxiety,
+            "satisfaction": satisfaction - self.satisfaction,
+            "engagement":   engagement   - self.engagement,
         }
+        self.trust, self.anxiety, self.satisfaction, self.engagement = trust, anxiety, satisfaction, engagement
+        self._adherence_cache = self._status_cache = None
+        return changes
 
     def adherence_score(self):
         """
         How likely (0–100%) is the client to actually follow your advice?
         High trust + low anxiety + low control preference = more likely to listen.
         """
-        score = (
-            50
-            + 0.5  * self.trust
-            - 0.4  * self.anxiety
-            - 0.2  * (self.control_preference - 50)
-        )
-        return clamp(int(score), 0, 100)
+        if self._adherence_cache is None:
+            score = (
+                50
+                + 0.5  * self.trust
+                - 0.4  * self.anxiety
+                - 0.2  * (self.control_preference - 50)
+            )
+            self._adherence_cache = clamp(int(score), 0, 100)
+        return self._adherence_cache
 
     def status_label(self):
         """Returns a simple overall status based on emotional state."""
-        avg = (self.trust + self.satisfaction + self.engagement) / 3
+        if self._status_cache is None:
+            self._status_cache = self._compute_status_label()
+        return self._status_cache
+
+    def _compute_status_label(self):
+        """The uncached status_label rules, in priority order."""
         if self.anxiety > 75:
             return "⚠️ Crisis Mode"
+        avg = (self.trust + self.satisfaction + self.engagement) / 3
         if avg > 70 and self.anxiety < 40:
             return "✅ Strong Relationship"
         if avg < 40 or self.trust < 30:
@@ -207,22 +239,32 @@ MARKET_REGIMES = {
     },
 }
 
+# Names and settings in matching order, built once so each turn just indexes into them
+_REGIME_NAMES  = tuple(MARKET_REGIMES)
+_REGIME_VALUES = tuple(MARKET_REGIMES.values())
+
+# Return ranges as (regime × [stocks, bonds, cash]) arrays, for the batch generator below
+_REGIME_LO = np.array([[r[a][0] for a in ("stocks", "bonds", "cash")] for r in _REGIME_VALUES])
+_REGIME_HI = np.array([[r[a][1] for a in ("stocks", "bonds", "cash")] for r in _REGIME_VALUES])
+
 
-def generate_market_turn():
+def generate_market_turn(rng=random):
     """
     Randomly selects a market regime and generates returns.
     Returns a dict with everything needed for the turn.
+    Pass rng=random.Random(seed) for a repeatable sequence of markets.
 
     KEY FIX vs old code:
     This is called ONCE per turn and stored in session state.
     The old code called this on every page render, making results random and meaningless.
     """
-    regime_name = random.choice(list(MARKET_REGIMES.keys()))
-    regime = MARKET_REGIMES[regime_name]
+    i           = rng.randrange(len(_REGIME_NAMES))
+    regime_name = _REGIME_NAMES[i]
+    regime      = _REGIME_VALUES[i]
 
-    stock_return = random.uniform(*regime["stocks"])
-    bond_return  = random.uniform(*regime["bonds"])
-    cash_return  = random.uniform(*regime["cash"])
+    stock_return = rng.uniform(*regime["stocks"])
+    bond_return  = rng.uniform(*regime["bonds"])
+    cash_return  = rng.uniform(*regime["cash"])
 
     return {
         "regime":       regime_name,
@@ -234,6 +276,24 @@ def generate_market_turn():
     }
 
 
+def generate_market_turns_batch(n, rng=None):
+    """
+    Generates n market turns at once, for simulations and sweeps rather than the game.
+    Returns (regimes, returns):
+      regimes — n indexes into MARKET_REGIMES (in its order)
+      returns — an (n, 3) array of stock, bond and cash returns
+
+    PROGRAMMING CONCEPT: Vectorization. Instead of a Python loop calling
+    random.uniform 3n times, numpy draws all the numbers in one call in C.
+    A fixed allocation's returns for every turn are then one matrix product:
+        returns @ np.array([0.70, 0.25, 0.05])
+    """
+    rng     = rng or np.random.default_rng()
+    regimes = rng.integers(0, len(_REGIME_NAMES), size=n)
+    returns = rng.uniform(_REGIME_LO[regimes], _REGIME_HI[regimes])
+    return regimes, returns
+
+
 def calculate_portfolio_return(portfolio, market):
     """
     Calculates the weighted portfolio return.
@@ -281,6 +341,13 @@ COMM_STYLE_EFFECTS = {
     },
 }
 
+# Styles that count as good crisis communication in the career score
+_GOOD_COMM_STYLES = frozenset({
+    "Empathize + explain calmly",
+    "Data-focused reassurance",
+    "Firm boundary (stick to the plan)",
+})
+
 # Recommendation choices and their portfolio + emotional impact
 RECOMMENDATION_EFFECTS = {
     "Stay the course (no change)": {
@@ -320,6 +387,26 @@ RECOMMENDATION_EFFECTS = {
     },
 }
 
+# The numbers from the two tables above as plain tuples, built once at import.
+# Each turn unpacks one tuple instead of doing a string-keyed lookup per number.
+_COMM_DELTAS = {
+    key: (e["d_trust"], e["d_anxiety"], e["d_satisfaction"], e["d_engagement"])
+    for key, e in COMM_STYLE_EFFECTS.items()
+}
+_REC_DELTAS = {
+    key: (e["d_trust"], e["d_anxiety"], e["d_satisfaction"])
+    for key, e in RECOMMENDATION_EFFECTS.items()
+}
+_REC_SHIFTS = {
+    key: (e["stock_shift"], e["bond_shift"], e["cash_shift"])
+    for key, e in RECOMMENDATION_EFFECTS.items()
+}
+
+# Which recommendations the career score counts as bad moves, decided once here
+# instead of lower-casing and searching every log entry's text at scoring time
+_PANIC_RECS   = frozenset(k for k in RECOMMENDATION_EFFECTS if "heavily to cash" in k.lower())
+_RISK_UP_RECS = frozenset(k for k in RECOMMENDATION_EFFECTS if "increase risk" in k.lower())
+
 
 def apply_recommendation(client, recommendation_key):
     """
@@ -328,20 +415,20 @@ def apply_recommendation(client, recommendation_key):
     Returns a description of what changed.
     """
     effect = RECOMMENDATION_EFFECTS[recommendation_key]
+    stock_shift, bond_shift, cash_shift = _REC_SHIFTS[recommendation_key]
+    portfolio = client.portfolio
 
-    client.portfolio["stocks"] += effect["stock_shift"]
-    client.portfolio["bonds"]  += effect["bond_shift"]
-    client.portfolio["cash"]   += effect["cash_shift"]
-
-    # Clamp each to 0–1 range first
-    for k in client.portfolio:
-        client.portfolio[k] = clamp(client.portfolio[k], 0.0, 1.0)
+    # Shift, then clamp each to 0–1 range (worked on as locals, written back once)
+    stocks = clamp(portfolio["stocks"] + stock_shift, 0.0, 1.0)
+    bonds  = clamp(portfolio["bonds"]  + bond_shift,  0.0, 1.0)
+    cash   = clamp(portfolio["cash"]   + cash_shift,  0.0, 1.0)
 
     # Normalize so they sum to 1.0
-    total = sum(client.portfolio.values())
+    total = stocks + bonds + cash
     if total > 0:
-        for k in client.portfolio:
-            client.portfolio[k] /= total
+        stocks, bonds, cash = stocks / total, bonds / total, cash / total
+
+    portfolio["stocks"], portfolio["bonds"], portfolio["cash"] = stocks, bonds, cash
 
     return effect
 
@@ -389,7 +476,9 @@ def calculate_full_turn_deltas(client, comm_style_key, recommendation_key, marke
     3. Recommendation impact
     4. Allocation fit check
 
-    Returns final deltas and a breakdown for display.
+    Returns final deltas and a breakdown for display. Breakdown entries are
+    (kind, details...) tuples; the UI turns them into sentences only when it
+    shows them, so callers that ignore the breakdown don't pay for the text.
     """
     breakdown = []
 
@@ -402,26 +491,26 @@ def calculate_full_turn_deltas(client, comm_style_key, recommendation_key, marke
 
     if d_anxiety != 0:
         direction = "increased" if d_anxiety > 0 else "decreased"
-        breakdown.append(f"📈 Market conditions {direction} anxiety by {abs(d_anxiety)} pts")
+        breakdown.append(("market", direction, abs(d_anxiety)))
 
     # 2. Communication style
-    comm = COMM_STYLE_EFFECTS[comm_style_key]
-    d_trust        += comm["d_trust"]
-    d_anxiety      += comm["d_anxiety"]
-    d_satisfaction += comm["d_satisfaction"]
-    d_engagement   += comm["d_engagement"]
-    breakdown.append(f"💬 Communication: {comm['label']}")
+    c_trust, c_anxiety, c_satisfaction, c_engagement = _COMM_DELTAS[comm_style_key]
+    d_trust        += c_trust
+    d_anxiety      += c_anxiety
+    d_satisfaction += c_satisfaction
+    d_engagement   += c_engagement
+    breakdown.append(("comm", COMM_STYLE_EFFECTS[comm_style_key]["label"]))
 
     # 3. Recommendation
-    rec = RECOMMENDATION_EFFECTS[recommendation_key]
-    d_trust        += rec["d_trust"]
-    d_anxiety      += rec["d_anxiety"]
-    d_satisfaction += rec["d_satisfaction"]
-    breakdown.append(f"📋 Recommendation: {rec['label']}")
+    r_trust, r_anxiety, r_satisfaction = _REC_DELTAS[recommendation_key]
+    d_trust        += r_trust
+    d_anxiety      += r_anxiety
+    d_satisfaction += r_satisfaction
+    breakdown.append(("rec", RECOMMENDATION_EFFECTS[recommendation_key]["label"]))
 
     # 4. Trait multipliers (personality affects how much each thing matters)
-    trust_mult  = 0.75 + (client.trust_propensity / 100) * 0.5   # 0.75 to 1.25
-    anxiety_mult = 0.75 + (client.loss_aversion   / 100) * 0.6   # 0.75 to 1.35
+    trust_mult   = client._trust_mult
+    anxiety_mult = client._anxiety_mult
 
     if d_trust > 0:
         d_trust = int(d_trust * trust_mult)
@@ -437,13 +526,13 @@ def calculate_full_turn_deltas(client, comm_style_key, recommendation_key, marke
     d_satisfaction += fit_sat
     d_engagement   += fit_eng
     if fit_msg:
-        breakdown.append(f"⚖️ Allocation fit: {fit_msg}")
+        breakdown.append(("fit", fit_msg))
 
-    # Final clamps
-    d_trust        = clamp(d_trust,        -20, 20)
-    d_anxiety      = clamp(d_anxiety,      -25, 25)
-    d_satisfaction = clamp(d_satisfaction, -15, 15)
-    d_engagement   = clamp(d_engagement,   -12, 12)
+    # Final clamps (clamp() written out inline — this runs every turn)
+    d_trust        = max(-20, min(20, d_trust))
+    d_anxiety      = max(-25, min(25, d_anxiety))
+    d_satisfaction = max(-15, min(15, d_satisfaction))
+    d_engagement   = max(-12, min(12, d_engagement))
 
     return d_trust, d_anxiety, d_satisfaction, d_engagement, breakdown
 
@@ -452,6 +541,17 @@ def calculate_full_turn_deltas(client, comm_style_key, recommendation_key, marke
 # CLIENT INTENT (for AI prompt context)
 # ─────────────────────────────────────────────
 
+# How each intent is described to the AI (built once, not on every turn)
+INTENT_DESCRIPTIONS = {
+    "override_threat":   "extremely anxious and threatening to override you and move everything to cash",
+    "panic":             "panicking and demanding action, not thinking clearly",
+    "concerned":         "genuinely worried and asking for explanation and reassurance",
+    "greedy":            "excited by recent gains and pushing to take on more risk",
+    "confident_checkin": "happy and satisfied, doing a routine check-in",
+    "neutral_checkin":   "calm and checking in on progress toward their goal",
+}
+
+
 def get_client_intent(client, portfolio_return):
     """
     Determines the emotional state/intent of the client this turn.
@@ -483,6 +583,10 @@ CAREER_TITLES = [
     (0,  "📉 Probationary Advisor",    "Significant improvement needed. Review your communication and portfolio management approach."),
 ]
 
+# Regimes the career score treats specially (sets, so each check is one hash lookup)
+_DOWNTURN_REGIMES = frozenset({"Bear Market", "Market Crisis"})                 # bad time to add risk
+_CRISIS_REGIMES   = frozenset({"Bear Market", "Market Crisis", "Rate Shock"})   # crisis-handling turns
+
 def calculate_career_score(log, client, final_portfolio_value, starting_value=100_000):
     """
     Calculates a final career score (0-100) from four weighted components.
@@ -527,38 +631,34 @@ def calculate_career_score(log, client, final_portfolio_value, starting_value=10
         + client.engagement * 0.15
     )
 
+    # ── Components 3 and 4 count things in the log — one pass does both ──
+    panic_moves = aggressive_swings = crisis_turns = good_crisis_comms = 0
+    for entry in log:
+        rec    = entry.get("recommendation")
+        regime = entry.get("regime")
+        if rec in _PANIC_RECS:
+            panic_moves += 1
+        elif rec in _RISK_UP_RECS and regime in _DOWNTURN_REGIMES:
+            aggressive_swings += 1
+        if regime in _CRISIS_REGIMES:
+            crisis_turns += 1
+            if entry.get("comm_style") in _GOOD_COMM_STYLES:
+                good_crisis_comms += 1
+
     # ── Component 3: Risk Management (25% of score) ──────────────────────
     # Were you consistent and disciplined, or did you panic and make big moves?
     # Count how many turns had "panic" moves or very aggressive shifts
-    panic_moves = sum(
-        1 for entry in log
-        if "heavily to cash" in entry.get("recommendation", "").lower()
-    )
-    aggressive_swings = sum(
-        1 for entry in log
-        if "increase risk" in entry.get("recommendation", "").lower()
-        and entry.get("regime") in ["Bear Market", "Market Crisis"]
-    )
     bad_moves = panic_moves + aggressive_swings
     risk_score = max(0, 100 - (bad_moves * 20))
 
     # ── Component 4: Crisis Handling (15% of score) ───────────────────────
     # How did you perform specifically during bear markets and crises?
     # A great advisor is most valuable when markets are bad.
-    crisis_turns = [
-        e for e in log
-        if e.get("regime") in ["Bear Market", "Market Crisis", "Rate Shock"]
-    ]
     if not crisis_turns:
         crisis_score = 70  # no crises — neutral score
     else:
-        # Check communication quality during crises
-        good_crisis_comms = sum(
-            1 for e in crisis_turns
-            if any(good in e.get("comm_style", "")
-                   for good in ["Empathize", "Data-focused", "Firm boundary"])
-        )
-        crisis_score = int((good_crisis_comms / len(crisis_turns)) * 100)
+        # Communication quality during crises
+        crisis_score = int((good_crisis_comms / crisis_turns) * 100)
 
     # ── Final Weighted Score ──────────────────────────────────────────────
     final_score = int(
@@ -577,7 +677,7 @@ def calculate_career_score(log, client, final_portfolio_value, starting_value=10
         "total_return_pct":   round(total_return * 100, 1),
         "benchmark_pct":      round(benchmark_return * 100, 1),
         "panic_moves":        panic_moves,
-        "crisis_turns":       len(crisis_turns),
+        "crisis_turns":       crisis_turns,
     }
 
     return final_score, breakdown
@@ -639,18 +739,9 @@ def get_scenario_context(client, market, portfolio_return, turn_number):
     """
     intent = get_client_intent(client, portfolio_return)
 
-    intent_descriptions = {
-        "override_threat":   "extremely anxious and threatening to override you and move everything to cash",
-        "panic":             "panicking and demanding action, not thinking clearly",
-        "concerned":         "genuinely worried and asking for explanation and reassurance",
-        "greedy":            "excited by recent gains and pushing to take on more risk",
-        "confident_checkin": "happy and satisfied, doing a routine check-in",
-        "neutral_checkin":   "calm and checking in on progress toward their goal",
-    }
-
     return {
         "intent": intent,
-        "intent_description": intent_descriptions[intent],
+        "intent_description": INTENT_DESCRIPTIONS[intent],
         "client_name": client.name,
         "client_goal": client.goal,
         "risk_tolerance": client.risk_tolerance,